@@ -8,10 +8,13 @@ stocks = ["NVDA", "GOOGL", "MSFT"]
 start_date = "2000-01-01"
 end_date = "2025-03-25"
 
-# Lấy dữ liệu cho từng cổ phiếu
+# Lấy dữ liệu cho tất cả cổ phiếu trong một lần gọi (yfinance tải song song bằng thread)
+df = yf.download(stocks, start=start_date, end=end_date, interval="1mo", threads=True)  # Lấy dữ liệu theo tháng
+
+# Lưu dữ liệu của từng cổ phiếu
 for stock in stocks:
-    df = yf.download(stock, start=start_date, end=end_date, interval="1mo")  # Lấy dữ liệu theo tháng
-    df.to_csv(f"{stock}_1year_monthly.csv")  # Lưu vào file CSV
+    df_stock = df.xs(stock, axis=1, level="Ticker", drop_level=False).dropna(how="all")  # Bỏ các tháng chưa niêm yết
+    df_stock.to_csv(f"{stock}_1year_monthly.csv")  # Lưu vào file CSV
     print(f"Đã lưu dữ liệu {stock} vào file {stock}_1year_monthly.csv")
 
 # Hiển thị dữ liệu của Nvidia
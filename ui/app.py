@@ -2,6 +2,15 @@ import random
 
 import streamlit as st
 
+# Danh sách phản hồi mẫu
+RESPONSES = (
+    "Tôi hiểu rồi.",
+    "Thật là thú vị!",
+    "Bạn có thể nói rõ hơn không?",
+    "Điều đó rất thú vị.",
+    "Tôi không chắc về điều đó."
+)
+
 # Tiêu đề ứng dụng
 st.title('🤖 Hỏi đáp thông tin giá cổ phiếu')
 
@@ -16,15 +25,7 @@ for message in st.session_state.messages:
 
 # Hàm tạo phản hồi giả lập
 def generate_response(user_message):
-    # Danh sách phản hồi mẫu
-    responses = [
-        "Tôi hiểu rồi.",
-        "Thật là thú vị!",
-        "Bạn có thể nói rõ hơn không?",
-        "Điều đó rất thú vị.",
-        "Tôi không chắc về điều đó."
-    ]
-    return random.choice(responses)
+    return random.choice(RESPONSES)
 
 # Ô nhập tin nhắn
 if prompt := st.chat_input("Nhập tin nhắn của bạn"):